@@ -1,6 +1,43 @@
-from .models import Dependency, Manifest, Mod, Release, Repo
-from .registry import FilesystemPackageRegistry, PackageRegistry
-from .retriever import GithubModMetadataRetriever, ModMetadataRetriever
-from .utils.hashes import sha512_sum
-from .utils.path_utils import repo_to_index_entry
-from .utils.redirect_manager import RedirectManager, SimpleRedirectManager
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .models import Dependency, Manifest, Mod, Release, Repo
+    from .registry import FilesystemPackageRegistry, PackageRegistry
+    from .retriever import GithubModMetadataRetriever, ModMetadataRetriever
+    from .utils.hashes import sha512_sum, sha512_sum_stream
+    from .utils.path_utils import repo_to_index_entry
+    from .utils.redirect_manager import RedirectManager, SimpleRedirectManager
+
+# Public names mapped to the module that defines them. They are imported on
+# first access so that importing the package (e.g. for the CLI) doesn't pull in
+# PyGithub and friends until something actually needs them.
+_EXPORTS: Dict[str, str] = {
+    "Dependency": ".models",
+    "Manifest": ".models",
+    "Mod": ".models",
+    "Release": ".models",
+    "Repo": ".models",
+    "FilesystemPackageRegistry": ".registry",
+    "PackageRegistry": ".registry",
+    "GithubModMetadataRetriever": ".retriever",
+    "ModMetadataRetriever": ".retriever",
+    "sha512_sum": ".utils.hashes",
+    "sha512_sum_stream": ".utils.hashes",
+    "repo_to_index_entry": ".utils.path_utils",
+    "RedirectManager": ".utils.redirect_manager",
+    "SimpleRedirectManager": ".utils.redirect_manager",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -3,46 +3,62 @@ from __future__ import annotations
 import argparse
 import logging
 import os
-
-from github import Auth, Github
+from typing import TYPE_CHECKING, Optional
 
 from zero_infra_mod_registry.models import Repo
 from zero_infra_mod_registry.registry import (FilesystemPackageRegistry,
                                               PackageRegistry)
-from zero_infra_mod_registry.retriever import GithubModMetadataRetriever
-
-# Configure logging
-level = os.environ.get("LOG_LEVEL", "WARNING")
-logging.basicConfig(
-    format="%(asctime)s %(levelname)s - %(message)s",
-    datefmt="%d-%b-%y %H:%M:%S",
-    level=level,
-)
+from zero_infra_mod_registry.registry.filesystem_package_registry import \
+    DEFAULT_MAX_CONCURRENT_FETCHES
+from zero_infra_mod_registry.retriever import ModMetadataRetriever
+from zero_infra_mod_registry.retriever.mod_metadata_retriever import \
+    DEFAULT_MAX_CONCURRENT_RELEASES
 
-# Default paths that can be overridden by environment variables
-DEFAULT_REGISTRY_PATH = os.environ.get("REGISTRY_PATH", "./registry")
-DEFAULT_PACKAGE_DB_DIR = os.environ.get("PACKAGE_DB_PATH", "./package_db")
+if TYPE_CHECKING:
+    from zero_infra_mod_registry.retriever import GithubModMetadataRetriever
 
 
 def main() -> None:
     """Main entry point for the CLI."""
+    # Configure logging
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s - %(message)s",
+        datefmt="%d-%b-%y %H:%M:%S",
+        level=os.environ.get("LOG_LEVEL", "WARNING"),
+    )
+
+    # Default paths that can be overridden by environment variables
+    default_registry_path = os.environ.get("REGISTRY_PATH", "./registry")
+    default_package_db_dir = os.environ.get("PACKAGE_DB_PATH", "./package_db")
+
     argparser = argparse.ArgumentParser(description="Manage the mod registry.")
 
     argparser.add_argument(
         "--dry-run", action="store_true", help="Don't actually make any changes."
     )
+    argparser.add_argument(
+        "--max-concurrent-fetches",
+        type=_positive_int,
+        default=DEFAULT_MAX_CONCURRENT_FETCHES,
+        help=(
+            "Maximum number of repos to fetch from GitHub at once. Each repo downloads "
+            f"up to {DEFAULT_MAX_CONCURRENT_RELEASES} releases at once, so up to this "
+            f"many times {DEFAULT_MAX_CONCURRENT_RELEASES} downloads can run together. "
+            f"Default: {DEFAULT_MAX_CONCURRENT_FETCHES}"
+        ),
+    )
 
     argparser.add_argument(
         "--registry-path",
         type=str,
-        default=DEFAULT_REGISTRY_PATH,
-        help=f"Path to the registry directory. Default: {DEFAULT_REGISTRY_PATH}",
+        default=default_registry_path,
+        help=f"Path to the registry directory. Default: {default_registry_path}",
     )
     argparser.add_argument(
         "--package-db-path",
         type=str,
-        default=DEFAULT_PACKAGE_DB_DIR,
-        help=f"Path to the package database directory. Default: {DEFAULT_PACKAGE_DB_DIR}",
+        default=default_package_db_dir,
+        help=f"Path to the package database directory. Default: {default_package_db_dir}",
     )
     argparser.add_argument(
         "--github-token",
@@ -85,45 +101,91 @@ def main() -> None:
     )
     args = argparser.parse_args()
 
-    # Create GitHub client and mod retriever
-    auth = Auth.Token(args.github_token or os.environ.get("GITHUB_TOKEN") or "")
-    github_client = Github(auth=auth)
-    mod_retriever = GithubModMetadataRetriever(github_client)
+    # Commands that only touch the local package db don't need GitHub at all.
+    if args.command == "validate":
+        _build_registry(args).validate_package_db([])
+        logging.info("Validation complete!")
+        return
+    elif args.command == "remove":
+        [org, repoName] = args.repo_url.strip().split("/")[-2:]
+        _build_registry(args).remove_mods([Repo(org, repoName)], args.dry_run)
+        return
+
+    # Closes the retriever's pooled connections, even if the command exits early
+    with _build_mod_retriever(args) as mod_retriever:
+        registry = _build_registry(args, mod_retriever)
+
+        if args.command == "process-registry-updates":
+            registry.process_registry_updates(args.dry_run)
+        elif args.command == "add_package":
+            [org, repoName] = args.repo_url.strip().split("/")[-2:]
+            num_added = registry.add_package([Repo(org, repoName)], args.dry_run)
+            if num_added == 0:
+                exit(1)
+        elif args.command == "add_package_release":
+            [org, repoName] = args.repo_url.strip().split("/")[-2:]
+            result = registry.add_package_release(
+                Repo(org, repoName),
+                args.release_tag.strip(),
+                args.dry_run,
+            )
+
+            if not result:
+                exit(1)
+        else:
+            logging.error("Unknown command.")
+            exit(1)
+
 
-    # Initialize the registry with the mod retriever
-    registry: PackageRegistry = FilesystemPackageRegistry(
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be a whole number, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _build_mod_retriever(args: argparse.Namespace) -> GithubModMetadataRetriever:
+    """
+    Create the GitHub backed mod retriever.
+
+    PyGithub is slow to import, so it's only imported once a command needs it.
+    """
+    from github import Auth, Github
+
+    from zero_infra_mod_registry.retriever import GithubModMetadataRetriever
+    from zero_infra_mod_registry.retriever.github_mod_metadata_retriever import \
+        build_download_session
+
+    # An empty token would still be sent, and rejected, so go unauthenticated instead
+    token = args.github_token or os.environ.get("GITHUB_TOKEN")
+    auth = Auth.Token(token) if token else None
+    # Each repo being fetched processes several releases at once, so keep one pooled
+    # connection per release thread. Use the largest page size the API allows so
+    # release listings take as few round trips as possible. Lazy objects skip the
+    # GET /repos/{org}/{repo} that get_repo would otherwise make before every
+    # release request.
+    pool_size = args.max_concurrent_fetches * DEFAULT_MAX_CONCURRENT_RELEASES
+    github_client = Github(auth=auth, per_page=100, pool_size=pool_size, lazy=True)
+    return GithubModMetadataRetriever(
+        github_client, build_download_session(pool_size), DEFAULT_MAX_CONCURRENT_RELEASES
+    )
+
+
+def _build_registry(
+    args: argparse.Namespace, mod_retriever: Optional[ModMetadataRetriever] = None
+) -> PackageRegistry:
+    """Create the package registry described by the CLI arguments."""
+    return FilesystemPackageRegistry(
         mod_retriever=mod_retriever,
         registry_path=args.registry_path,
         package_db_path=args.package_db_path,
+        max_concurrent_fetches=args.max_concurrent_fetches,
     )
 
-    if args.command == "process-registry-updates":
-        registry.process_registry_updates(args.dry_run)
-    elif args.command == "add_package":
-        [org, repoName] = args.repo_url.strip().split("/")[-2:]
-        num_added = registry.add_package([Repo(org, repoName)], args.dry_run)
-        if num_added == 0:
-            exit(1)
-    elif args.command == "add_package_release":
-        [org, repoName] = args.repo_url.strip().split("/")[-2:]
-        result = registry.add_package_release(
-            Repo(org, repoName),
-            args.release_tag.strip(),
-            args.dry_run,
-        )
-
-        if not result:
-            exit(1)
-    elif args.command == "remove":
-        [org, repoName] = args.repo_url.strip().split("/")[-2:]
-        registry.remove_mods([Repo(org, repoName)], args.dry_run)
-    elif args.command == "validate":
-        registry.validate_package_db([])
-        logging.info("Validation complete!")
-    else:
-        logging.error("Unknown command.")
-        exit(1)
-
 
 if __name__ == "__main__":
     main()
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Dict, List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Repo:
     org: str
     name: str
@@ -14,8 +14,13 @@ class Repo:
     def github_url(self) -> str:
         return f"https://github.com/{self.org}/{self.name}"
 
+    @staticmethod
+    def from_index_entry(entry: str) -> "Repo":
+        org, _, name = entry.partition("/")
+        return Repo(org=org, name=name)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Dependency:
     repo_url: str
     version: str
@@ -25,7 +30,7 @@ class Dependency:
         return Dependency(repo_url=data["repo_url"], version=data["version"])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Manifest:
     repo_url: str
     name: str
@@ -50,7 +55,7 @@ class Manifest:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Release:
     tag: str
     hash: str
@@ -69,7 +74,7 @@ class Release:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Mod:
     latest_manifest: Manifest
     releases: List[Release]
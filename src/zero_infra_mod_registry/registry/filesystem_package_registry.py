@@ -1,30 +1,39 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
-from datetime import datetime
-from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
+import orjson
 from semantic_version import SimpleSpec, Version
 
 from zero_infra_mod_registry.models import Dependency, Mod, Release, Repo
 from zero_infra_mod_registry.registry.package_registry import PackageRegistry
-from zero_infra_mod_registry.retriever import (
-    GithubModMetadataRetriever,
-    ModMetadataRetriever,
-)
+from zero_infra_mod_registry.retriever import ModMetadataRetriever
 from zero_infra_mod_registry.utils.path_utils import repo_to_index_entry
 from zero_infra_mod_registry.utils.redirect_manager import SimpleRedirectManager
 
+# Default upper bound on concurrent repo metadata fetches, to stay well clear of
+# GitHub's secondary rate limits.
+DEFAULT_MAX_CONCURRENT_FETCHES = 8
 
-class PackageManagerJsonEncoder(json.JSONEncoder):
-    """A custom JSON encoder that can encode datetime objects."""
 
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return json.JSONEncoder.default(self, obj)
+@lru_cache(maxsize=4096)
+def _parse_version(tag: str) -> Version:
+    """Parse a release tag into a Version, ignoring a leading "v"."""
+    if tag.startswith("v"):
+        tag = tag[1:]
+    return Version(tag)
+
+
+@lru_cache(maxsize=4096)
+def _parse_spec(version: str) -> SimpleSpec:
+    """Parse a dependency's version requirement into a SimpleSpec, ignoring a leading "v"."""
+    if version.startswith("v"):
+        version = version[1:]
+    return SimpleSpec(version)
 
 
 class FilesystemPackageRegistry(PackageRegistry):
@@ -36,40 +45,106 @@ class FilesystemPackageRegistry(PackageRegistry):
 
     def __init__(
         self,
-        mod_retriever: ModMetadataRetriever,
-        registry_path: str = os.environ.get("REGISTRY_PATH", "./registry"),
-        package_db_path: str = os.environ.get("PACKAGE_DB_PATH", "./package_db"),
+        mod_retriever: Optional[ModMetadataRetriever],
+        registry_path: Optional[str] = None,
+        package_db_path: Optional[str] = None,
+        max_concurrent_fetches: int = DEFAULT_MAX_CONCURRENT_FETCHES,
     ):
         """
         Initialize the FilesystemPackageRegistry.
 
         Args:
-            registry_path: Path to the registry directory
-            package_db_path: Path to the package database directory
-            mod_retriever: ModMetadataRetriever implementation to use for fetching repo and release metadata
+            registry_path: Path to the registry directory. Defaults to the REGISTRY_PATH
+                environment variable, or ./registry
+            package_db_path: Path to the package database directory. Defaults to the
+                PACKAGE_DB_PATH environment variable, or ./package_db
+            mod_retriever: ModMetadataRetriever implementation to use for fetching repo and release metadata.
+                May be None for registries that are only validated or have mods removed.
+            max_concurrent_fetches: Maximum number of repos to fetch metadata for at once
+
+        Raises:
+            ValueError: If max_concurrent_fetches is less than 1
         """
+        if max_concurrent_fetches < 1:
+            raise ValueError(
+                f"max_concurrent_fetches must be at least 1, got {max_concurrent_fetches}."
+            )
+
+        if registry_path is None:
+            registry_path = os.environ.get("REGISTRY_PATH", "./registry")
+        if package_db_path is None:
+            package_db_path = os.environ.get("PACKAGE_DB_PATH", "./package_db")
+
         self.registry_path = registry_path
         self.package_db_path = package_db_path
         self.packages_dir = os.path.join(package_db_path, "packages")
         self.mod_list_index_path = os.path.join(package_db_path, "mod_list_index.txt")
         self.redirects_path = os.path.join(package_db_path, "redirects.txt")
 
-        # Create package_db_path directory if it doesn't exist
-        if not os.path.exists(self.package_db_path):
-            os.makedirs(self.package_db_path, exist_ok=True)
-
-        # Create packages directory if it doesn't exist
-        if not os.path.exists(self.packages_dir):
-            os.makedirs(self.packages_dir, exist_ok=True)
+        # Create the packages directory, and package_db_path along with it, if they don't exist
+        os.makedirs(self.packages_dir, exist_ok=True)
 
-        # Setup JSON encoder
-        self.json_encoder = PackageManagerJsonEncoder()
+        self._mod_retriever = mod_retriever
+        self.max_concurrent_fetches = max_concurrent_fetches
 
-        self.mod_retriever = mod_retriever
+        # Parsed mod files keyed by path, along with the (mtime, size) they were parsed at
+        self._mod_cache: Dict[str, Tuple[Tuple[int, int], Mod]] = {}
+        # Package list entries keyed by path, along with the (mtime, size) they were read at
+        self._package_set_cache: Dict[str, Tuple[Tuple[int, int], FrozenSet[str]]] = {}
 
         # Load redirect manager
         self.redirect_manager = SimpleRedirectManager.from_file(self.redirects_path)
 
+    @property
+    def mod_retriever(self) -> ModMetadataRetriever:
+        """The retriever used to fetch repo and release metadata."""
+        if self._mod_retriever is None:
+            raise ValueError("This package registry was created without a mod retriever.")
+        return self._mod_retriever
+
+    def _mod_file_path(self, org: str, name: str) -> str:
+        """
+        Get the path of a mod's JSON file in the package DB.
+
+        Args:
+            org: The organization name
+            name: The repository name
+
+        Returns:
+            Path to the mod file
+        """
+        return os.path.join(self.packages_dir, org, f"{name}.json")
+
+    def _load_mod_cached(self, path: str) -> Mod:
+        """
+        Load a mod file, reusing the previously parsed Mod if the file hasn't changed.
+
+        Args:
+            path: Path to the mod's JSON file
+
+        Returns:
+            The parsed Mod object
+
+        Raises:
+            FileNotFoundError: If the mod file doesn't exist
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._mod_cache.pop(path, None)
+            raise
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._mod_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with open(path, "rb") as file:
+            mod = Mod.from_dict(orjson.loads(file.read()))
+
+        self._mod_cache[path] = (key, mod)
+        return mod
+
     def _load_package_list(self, path: str) -> List[str]:
         """
         Load a package list from a file.
@@ -82,44 +157,141 @@ class FilesystemPackageRegistry(PackageRegistry):
         """
         try:
             with open(path, "r") as file:
-                return list(
-                    filter(
-                        lambda x: x != "",
-                        map(lambda x: x.strip(), file.read().splitlines()),
-                    )
-                )
+                return [line for line in map(str.strip, file) if line]
         except FileNotFoundError:
             return []
 
-    def _get_all_text_lines_in_directory(self, directory: str) -> List[str]:
+    def _iter_text_files(self, directory: str, recursive: bool = False) -> Iterator[str]:
+        """
+        Yield the paths of all .txt files in a directory.
+
+        Args:
+            directory: Directory to look in
+            recursive: If True, also descend into subdirectories, except for redirects
+
+        Returns:
+            Iterator of file paths
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            return
+
+        for entry in entries:
+            # Ensure it's a file and not another directory or symbolic link
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith(".txt"):
+                yield entry.path
+            elif (
+                recursive
+                and entry.is_dir(follow_symlinks=False)
+                and entry.name != "redirects"
+            ):
+                yield from self._iter_text_files(entry.path, recursive)
+
+    def _load_package_set(self, path: str) -> FrozenSet[str]:
+        """
+        Load a package list from a file as a set, reusing the previous result if
+        the file hasn't changed.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Set of package names
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._package_set_cache.pop(path, None)
+            return frozenset()
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._package_set_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        packages = frozenset(self._load_package_list(path))
+        self._package_set_cache[path] = (key, packages)
+        return packages
+
+    def _read_text_file(self, path: str) -> Optional[str]:
+        """
+        Read the full contents of a text file.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            The file contents, or None if the file doesn't exist
+        """
+        try:
+            with open(path, "r") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_text_file_atomic(self, path: str, content: str) -> None:
+        """
+        Write a text file by writing a temporary file next to it and moving it into
+        place, so that a crash mid-write can't leave a truncated file behind.
+
+        Args:
+            path: Path to the file
+            content: Text to write
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(content.encode())
+            # Make sure the data is on disk before renaming over the old file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+
+    def _append_line(self, path: str, line: str) -> None:
+        """
+        Append a line to a text file, first terminating the existing last line if
+        it has no trailing newline.
+
+        Args:
+            path: Path to the file
+            line: Line to append, without a newline
+        """
+        with open(path, "ab+") as file:
+            prefix = b""
+            if file.tell() > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    prefix = b"\n"
+            file.write(prefix + line.encode() + b"\n")
+
+    def _get_all_text_lines_in_directory(
+        self, directory: str, recursive: bool = False
+    ) -> List[str]:
         """
         Gets all lines from all files, ignoring any empty lines or lines starting with #
 
         Args:
             directory: Directory to read files from
+            recursive: If True, also read files in subdirectories, except for redirects
 
         Returns:
             List of text lines
         """
         all_lines: List[str] = []
 
-        # Make sure directory exists
-        if not os.path.exists(directory):
-            return all_lines
-
-        # Get all files in the directory
-        for filename in os.listdir(directory):
-            filepath = os.path.join(directory, filename)
-
-            # Ensure it's a file and not another directory or symbolic link
-            if os.path.isfile(filepath) and filepath.endswith(".txt"):
-                logging.info(f"Reading file: {filepath}")
-                with open(filepath, "r") as file:
-                    for line in file:
-                        line = line.strip()
-                        # Exclude lines that start with '#' or are empty
-                        if not line.startswith("#") and line != "":
-                            all_lines.append(line)
+        for filepath in self._iter_text_files(directory, recursive):
+            logging.info(f"Reading file: {filepath}")
+            # These files are small, so read each in one go and only decode kept lines
+            with open(filepath, "rb") as file:
+                data = file.read()
+
+            # Exclude lines that start with '#' or are empty
+            all_lines.extend(
+                line.decode()
+                for line in map(bytes.strip, data.splitlines())
+                if line and not line.startswith(b"#")
+            )
 
         return all_lines
 
@@ -134,7 +306,10 @@ class FilesystemPackageRegistry(PackageRegistry):
             List of package names
         """
         return list(
-            map(repo_to_index_entry, self._get_all_text_lines_in_directory(directory))
+            map(
+                repo_to_index_entry,
+                self._get_all_text_lines_in_directory(directory, recursive=True),
+            )
         )
 
     def process_registry_updates(self, dry_run: bool = False) -> bool:
@@ -149,32 +324,37 @@ class FilesystemPackageRegistry(PackageRegistry):
             True if processing was successful, False otherwise
         """
         redirects_dir = os.path.join(self.registry_path, "redirects")
-        redirect_lines = self._get_all_text_lines_in_directory(redirects_dir)
+        # Sorted so the written redirects file doesn't depend on directory order
+        redirect_lines = sorted(self._get_all_text_lines_in_directory(redirects_dir))
         redirect_manager = SimpleRedirectManager.parse_redirects(redirect_lines)
 
-        existing_redirect_manager = SimpleRedirectManager.from_file(self.redirects_path)
-
         logging.info(f"Loaded {len(redirect_manager.redirects)} new redirect entries.")
+        # The current redirects file was already loaded when the registry was created
         logging.info(
-            f"Found {len(existing_redirect_manager.redirects)} existing redirect entries."
+            f"Found {len(self.redirect_manager.redirects)} existing redirect entries."
         )
 
-        # Write new redirects to file (if not dry run)
+        # Write new redirects to file (if not dry run and they changed)
         if not dry_run:
-            logging.info("Writing new redirects to file " + self.redirects_path)
-            with open(self.redirects_path, "w") as file:
-                file.write("\n".join(redirect_lines))
+            redirects_content = "\n".join(redirect_lines)
+            if self._read_text_file(self.redirects_path) == redirects_content:
+                logging.info("Redirects unchanged; not rewriting " + self.redirects_path)
+            else:
+                logging.info("Writing new redirects to file " + self.redirects_path)
+                self._write_text_file_atomic(self.redirects_path, redirects_content)
 
             # Update the instance's redirect manager
             self.redirect_manager = redirect_manager
 
         logging.info("Loading package list entries...")
-        updated_index_entries = self._generate_package_list(self.registry_path)
+        updated_set = set(self._generate_package_list(self.registry_path))
+        previous_set = self._load_package_set(self.mod_list_index_path)
 
-        previous_index_entries = self._load_package_list(self.mod_list_index_path)
-
-        new_entries = list(set(updated_index_entries) - set(previous_index_entries))
-        removed_entries = list(set(previous_index_entries) - set(updated_index_entries))
+        # Only the entries that differ need parsing into Repos
+        new_entries = list(map(Repo.from_index_entry, sorted(updated_set - previous_set)))
+        removed_entries = list(
+            map(Repo.from_index_entry, sorted(previous_set - updated_set))
+        )
         failed = False
 
         if len(new_entries) > 0:
@@ -182,9 +362,9 @@ class FilesystemPackageRegistry(PackageRegistry):
                 f"Adding {len(new_entries)} new packages to the package list..."
             )
             try:
-                split_entries = [entry.split("/") for entry in new_entries]
-                repo_entries = [Repo(entry[0], entry[1]) for entry in split_entries]
-                self.add_package(repo_entries, dry_run)
+                # add_package reports failed fetches by returning 0 rather than raising
+                if self.add_package(new_entries, dry_run) == 0:
+                    failed = True
             except Exception as e:
                 # If we fail to initialize a repo, remove it from the package list
                 logging.error(f"Failed to initialize repos: {e}\n")
@@ -195,9 +375,7 @@ class FilesystemPackageRegistry(PackageRegistry):
                 f"Removing {len(removed_entries)} packages from the package list..."
             )
             try:
-                split_entries = [entry.split("/") for entry in removed_entries]
-                repo_entries = [Repo(entry[0], entry[1]) for entry in split_entries]
-                self.remove_mods(repo_entries, dry_run)
+                self.remove_mods(removed_entries, dry_run)
             except Exception as e:
                 # If we fail to remove a repo, add it back to the package list
                 logging.error(f"Failed to remove repos: {e}\n")
@@ -212,9 +390,14 @@ class FilesystemPackageRegistry(PackageRegistry):
             logging.warning("Dry run; not writing to package list.")
             return True
 
-        # Write to mod_list_index_path
-        with open(self.mod_list_index_path, "w") as file:
-            file.write("\n".join(updated_index_entries))
+        if updated_set == previous_set:
+            logging.info("Package list unchanged.")
+            return True
+
+        # Write to mod_list_index_path, sorted so that reruns give the same file
+        index_content = "".join(f"{entry}\n" for entry in sorted(updated_set))
+        self._write_text_file_atomic(self.mod_list_index_path, index_content)
+        self._package_set_cache.pop(self.mod_list_index_path, None)
 
         logging.info("Package list built.")
         return True
@@ -231,7 +414,11 @@ class FilesystemPackageRegistry(PackageRegistry):
             The number of repositories successfully initialized
         """
         logging.info(f"Initializing {len(repos)} repos...")
-        mods = [self.mod_retriever.fetch_repo_metadata(repo) for repo in repos]
+        # Fail now, rather than once per repo in the worker threads, if there's no retriever
+        self.mod_retriever
+        # Fetching is network bound, so overlap the requests for each repo.
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_fetches) as executor:
+            mods = list(executor.map(self._fetch_repo_metadata, repos))
         filtered_mods = [mod for mod in mods if mod is not None]
 
         if len(filtered_mods) != len(repos):
@@ -242,92 +429,96 @@ class FilesystemPackageRegistry(PackageRegistry):
             )
             return 0  # Return 0 for failure
 
-        self.validate_package_db(filtered_mods)
+        self.validate_new_mods(filtered_mods)
 
         if dry_run:
             logging.warning("Dry run; not writing to package dir or registry.")
             return len(filtered_mods)  # Return count of repos that would be initialized
 
         # Create registry directory if it doesn't exist
-        if not os.path.exists(self.registry_path):
-            os.makedirs(self.registry_path, exist_ok=True)
+        try:
+            os.makedirs(self.registry_path)
             logging.info(f"Created registry directory: {self.registry_path}")
+        except FileExistsError:
+            pass
 
-        # Process each mod
-        for mod in filtered_mods:
-            # Parse and log the URL components
-            url_parts = mod.latest_manifest.repo_url.split("/")
-            logging.info(f"URL Parts: {url_parts}")
-
-            # Extract org and repo name
-            org = url_parts[-2]
-            repoName = url_parts[-1]
-            # Handle trailing slash in URL
-            if repoName == "":
-                repoName = url_parts[-2]
-                org = url_parts[-3]
+        # Read the registry once up front rather than rescanning it for every mod
+        existing_urls: Set[str] = set(
+            self._get_all_text_lines_in_directory(self.registry_path, recursive=True)
+        )
+        existing_entries: Set[str] = set(map(repo_to_index_entry, existing_urls))
 
-            logging.info(
-                f"Extracted org={org}, repoName={repoName} from {mod.latest_manifest.repo_url}"
-            )
+        # Org directories already made during this call, so each is only created once
+        created_dirs: Set[str] = set()
 
+        # Process each mod. Every fetch succeeded by this point, so mods line up with repos.
+        for repo, mod in zip(repos, filtered_mods):
             # Create org directory if it doesn't exist
-            org_dir = os.path.join(self.packages_dir, org)
-            if not os.path.exists(org_dir):
+            org_dir = os.path.join(self.packages_dir, repo.org)
+            if org_dir not in created_dirs:
                 os.makedirs(org_dir, exist_ok=True)
+                created_dirs.add(org_dir)
 
             # Write mod metadata to package db
-            mod_file_path = os.path.join(self.packages_dir, org, f"{repoName}.json")
-            with open(mod_file_path, "w") as file:
-                file.write(self.json_encoder.encode(mod.asdict()))
+            mod_file_path = self._mod_file_path(repo.org, repo.name)
+            with open(mod_file_path, "wb") as file:
+                file.write(orjson.dumps(mod.asdict()))
+            self._mod_cache.pop(mod_file_path, None)
 
             # Add to registry index
-            repo_url = mod.latest_manifest.repo_url
-            index_entry = f"{org}/{repoName}"
+            repo_url = repo.github_url()
+            index_entry = str(repo)
 
-            # Debug URL parsing
             logging.info(f"Adding {index_entry} to registry, URL: {repo_url}")
 
-            # Create org directory in registry if it doesn't exist
-            registry_org_index = os.path.join(self.registry_path, f"{org}.txt")
+            registry_org_dir = os.path.join(self.registry_path, repo.org)
+            registry_org_index = os.path.join(registry_org_dir, f"{repo.name}.txt")
 
             # Check if the entry already exists in any file in the registry
-            found = False
-            for root, _, files in os.walk(self.registry_path):
-                for relative_path in files:
-                    if relative_path.endswith(".txt"):
-                        file_path = os.path.join(root, relative_path)
-                        try:
-                            with open(file_path, "r") as f:
-                                content = f.read()
-                                if repo_url in content or index_entry in content:
-                                    found = True
-                                    logging.info(
-                                        f"Package {index_entry} already exists in {file_path}"
-                                    )
-                                    break
-                        except Exception as e:
-                            logging.warning(f"Error reading file {file_path}: {e}")
-                if found:
-                    break
-
-            if not found:
+            found = repo_url in existing_urls or index_entry in existing_entries
+            if found:
+                logging.info(f"Package {index_entry} already exists in the registry")
+            else:
+                # Create org directory in registry if it doesn't exist
+                if registry_org_dir not in created_dirs:
+                    os.makedirs(registry_org_dir, exist_ok=True)
+                    created_dirs.add(registry_org_dir)
+
                 # Write the repository URL to the file
                 with open(registry_org_index, "a") as f:
-                    f.write(f"{repo_url}")
+                    f.write(f"{repo_url}\n")
+                existing_urls.add(repo_url)
+                existing_entries.add(index_entry)
 
-                with open(self.mod_list_index_path, "a") as f:
-                    f.write(f"{index_entry}")
+                self._append_line(self.mod_list_index_path, index_entry)
+                self._package_set_cache.pop(self.mod_list_index_path, None)
 
                 logging.info(
                     f"Added {index_entry} to the registry index at {registry_org_index}"
                 )
 
-            logging.info(f"Repo {org}/{repoName} initialized.")
+            logging.info(f"Repo {repo} initialized.")
 
         logging.info("Successfully initialized all repos.")
         return len(filtered_mods)  # Return the count of successfully initialized repos
 
+    def _fetch_repo_metadata(self, repo: Repo) -> Optional[Mod]:
+        """
+        Fetch metadata for a repo, treating any error as a failed fetch so that one
+        bad repo doesn't discard the results for the others.
+
+        Args:
+            repo: Repository to fetch metadata for
+
+        Returns:
+            The fetched Mod object, or None if the fetch failed
+        """
+        try:
+            return self.mod_retriever.fetch_repo_metadata(repo)
+        except Exception as e:
+            logging.error(f"Failed to fetch metadata for repo {repo}: {e}")
+            return None
+
     def _is_package_in_index(self, repo: Repo) -> bool:
         """
         Check if a package exists in the mod list index.
@@ -339,9 +530,7 @@ class FilesystemPackageRegistry(PackageRegistry):
             True if the package exists in the index, False otherwise
         """
         try:
-            index_entries = self._load_package_list(self.mod_list_index_path)
-            index_entry = f"{repo.org}/{repo.name}"
-            return index_entry in index_entries
+            return str(repo) in self._load_package_set(self.mod_list_index_path)
         except Exception as e:
             logging.error(f"Failed to check if package {repo} is in index: {e}")
             return False
@@ -395,17 +584,17 @@ class FilesystemPackageRegistry(PackageRegistry):
 
         updated_mod = self.mod_retriever.update_mod_with_release(mod, release)
 
-        self.validate_package_db([updated_mod])
+        self.validate_new_mods([updated_mod])
 
         if dry_run:
             logging.warning("Dry run; not writing to mod metadata.")
             return True  # Return 1 to indicate success in dry run mode
 
-        [org, repoName] = repo.github_url().split("/")[-2:]
-        mod_file_path = os.path.join(self.packages_dir, org, f"{repoName}.json")
-        with open(mod_file_path, "w") as file:
+        mod_file_path = self._mod_file_path(repo.org, repo.name)
+        with open(mod_file_path, "wb") as file:
             logging.info(f"Writing updated mod metadata for {repo}...")
-            file.write(self.json_encoder.encode(updated_mod.asdict()))
+            file.write(orjson.dumps(updated_mod.asdict()))
+        self._mod_cache.pop(mod_file_path, None)
 
         logging.info(f"Successfully added release {release_tag} to repo {repo}.")
         return True  # Return 1 for successful release addition
@@ -432,9 +621,7 @@ class FilesystemPackageRegistry(PackageRegistry):
             count = sum(
                 1
                 for repo in repo_list
-                if os.path.exists(
-                    os.path.join(self.packages_dir, repo.org, f"{repo.name}.json")
-                )
+                if os.path.exists(self._mod_file_path(repo.org, repo.name))
             )
             return count > 0
 
@@ -443,20 +630,24 @@ class FilesystemPackageRegistry(PackageRegistry):
 
         for repo in repo_list:
             # Path to mod file
-            org_dir = os.path.join(self.packages_dir, repo.org)
-            mod_file_path = os.path.join(org_dir, f"{repo.name}.json")
+            mod_file_path = self._mod_file_path(repo.org, repo.name)
+            org_dir = os.path.dirname(mod_file_path)
 
-            if os.path.exists(mod_file_path):
+            try:
                 os.remove(mod_file_path)
+                self._mod_cache.pop(mod_file_path, None)
                 logging.info(f"Successfully removed mod {repo}.")
                 removed_count += 1
-            else:
+            except FileNotFoundError:
                 logging.warning(f"Mod file for {repo} not found at {mod_file_path}")
 
-            # If org directory is empty, remove it
-            if os.path.exists(org_dir) and not os.listdir(org_dir):
-                logging.info(f"Removing empty org {repo.org}...")
+            # If org directory is empty, remove it. rmdir refuses non-empty
+            # directories, so there's no need to look inside first.
+            try:
                 os.rmdir(org_dir)
+                logging.info(f"Removed empty org {repo.org}.")
+            except OSError:
+                pass
 
         logging.info(f"Successfully removed {removed_count} mods.")
         return removed_count > 0
@@ -472,11 +663,7 @@ class FilesystemPackageRegistry(PackageRegistry):
             The loaded Mod object, or None if it doesn't exist
         """
         try:
-            org_dir = os.path.join(self.packages_dir, repo.org)
-            mod_file_path = os.path.join(org_dir, f"{repo.name}.json")
-            with open(mod_file_path, "r") as file:
-                mod_dict = json.loads(file.read())
-                return Mod.from_dict(mod_dict)
+            return self._load_mod_cached(self._mod_file_path(repo.org, repo.name))
         except FileNotFoundError:
             return None
 
@@ -499,34 +686,28 @@ class FilesystemPackageRegistry(PackageRegistry):
 
         # Load all mods
         for package in packages:
-            [org, name] = package.split("/")
-            package_path = os.path.join(self.packages_dir, org, f"{name}.json")
+            package_repo = Repo.from_index_entry(package)
+            package_path = self._mod_file_path(package_repo.org, package_repo.name)
             if mod_path_filter(package_path):
                 try:
-                    with open(package_path, "r") as file:
-                        mod_dict = json.loads(file.read())
-                        mod = Mod.from_dict(mod_dict)
+                    mod = self._load_mod_cached(package_path)
 
-                        if mod is None:
-                            logging.error(
-                                f"Failed to load mod {package} during validation."
-                            )
-                            return False
+                    if mod is None:
+                        logging.error(
+                            f"Failed to load mod {package} during validation."
+                        )
+                        return False
 
-                        mods.append(mod)
+                    mods.append(mod)
 
                 except FileNotFoundError:
                     logging.error(f"Package {package} not found during validation.")
                     return False
 
-        # Check for missing dependencies
-        missing_deps: List[Tuple[Release, Dependency]] = []
-        for mod in mods:
-            for release in mod.releases:
-                for dep in release.manifest.dependencies:
-                    found_release = self._find_dependency(mods, dep)
-                    if found_release is None:
-                        missing_deps.append((release, dep))
+        # Check for missing dependencies. Redirects are resolved through a memo for
+        # this validation only, so later changes to the redirects are still seen.
+        resolve = lru_cache(maxsize=None)(self.redirect_manager.resolve)
+        missing_deps = self._find_missing_dependencies(mods, mods, resolve)
 
         if len(missing_deps) > 0:
             logging.error(f"{len(missing_deps)} missing dependencies:")
@@ -542,35 +723,134 @@ class FilesystemPackageRegistry(PackageRegistry):
         logging.info("Package database is valid.")
         return True
 
-    def _find_dependency(self, mods: List[Mod], dep: Dependency) -> Optional[Release]:
+    def validate_new_mods(self, new_mods: List[Mod]) -> bool:
         """
-        Find a dependency in the list of mods.
+        Check that the dependencies of mods about to be added are satisfied, loading
+        only the package files those dependencies point at. If any dependency can't
+        be found that way, falls back to validating the whole package database.
 
         Args:
-            mods: List of mods to search in
-            dep: Dependency to find
+            new_mods: Mods about to be added or updated
 
         Returns:
-            The found Release object, or None if not found
+            True if all dependencies of the new mods are satisfied, False otherwise
+        """
+        resolve = lru_cache(maxsize=None)(self.redirect_manager.resolve)
+        required_urls = {
+            resolve(dep.repo_url)
+            for mod in new_mods
+            for release in mod.releases
+            for dep in release.manifest.dependencies
+        }
+
+        mods: List[Mod] = new_mods.copy()
+        for url in required_urls:
+            repo = Repo.from_index_entry(repo_to_index_entry(url))
+            mod_file_path = self._mod_file_path(repo.org, repo.name)
+            try:
+                mods.append(self._load_mod_cached(mod_file_path))
+            except FileNotFoundError:
+                pass
+
+        if self._find_missing_dependencies(new_mods, mods, resolve, fail_fast=True):
+            # The dependency may be stored under a different name, so let the full
+            # validation decide and report what is missing.
+            return self.validate_package_db(new_mods)
+
+        logging.info("Dependencies of new mods are satisfied.")
+        return True
+
+    def _find_missing_dependencies(
+        self,
+        mods_to_check: List[Mod],
+        available_mods: List[Mod],
+        resolve: Callable[[str], str],
+        fail_fast: bool = False,
+    ) -> List[Tuple[Release, Dependency]]:
+        """
+        Find the dependencies of some mods that no available mod satisfies.
+
+        Args:
+            mods_to_check: Mods whose dependencies should be checked
+            available_mods: Mods that may satisfy those dependencies
+            resolve: Function resolving a repo URL through the redirects
+            fail_fast: If True, stop at the first missing dependency
+
+        Returns:
+            List of (release, dependency) pairs for each missing dependency
+        """
+        releases_by_url = self._index_releases(available_mods, resolve)
+        missing_deps: List[Tuple[Release, Dependency]] = []
+        for mod in mods_to_check:
+            for release in mod.releases:
+                for dep in release.manifest.dependencies:
+                    found_release = self._find_dependency(
+                        releases_by_url, dep, resolve
+                    )
+                    if found_release is None:
+                        missing_deps.append((release, dep))
+                        if fail_fast:
+                            return missing_deps
+
+        return missing_deps
+
+    def _index_releases(
+        self, mods: List[Mod], resolve: Callable[[str], str]
+    ) -> Dict[str, List[Tuple[Version, Release]]]:
         """
+        Group the releases of all mods by their resolved repo URL, with each
+        release's version parsed up front.
+
+        Args:
+            mods: List of mods to index
+            resolve: Function resolving a repo URL through the redirects
+
+        Returns:
+            Dict of resolved repo URL to (version, release) pairs, in mod order
+        """
+        releases_by_url: Dict[str, List[Tuple[Version, Release]]] = {}
         for mod in mods:
             for release in mod.releases:
-                release_tag = release.tag
-                if release_tag.startswith("v"):
-                    release_tag = release_tag[1:]
+                try:
+                    version = _parse_version(release.tag)
+                except ValueError:
+                    logging.warning(
+                        f"Ignoring release {release.tag} of {release.manifest.repo_url}: not a valid version."
+                    )
+                    continue
 
-                dep_version = dep.version
-                if dep_version.startswith("v"):
-                    dep_version = dep_version[1:]
+                resolved_url = resolve(release.manifest.repo_url)
+                releases_by_url.setdefault(resolved_url, []).append((version, release))
 
-                resolved_manifest_url = self.redirect_manager.resolve(
-                    release.manifest.repo_url
-                )
-                resolved_dep_url = self.redirect_manager.resolve(dep.repo_url)
-                if resolved_manifest_url == resolved_dep_url and Version(
-                    release_tag
-                ) in SimpleSpec(dep_version):
-                    return release
+        return releases_by_url
+
+    def _find_dependency(
+        self,
+        releases_by_url: Dict[str, List[Tuple[Version, Release]]],
+        dep: Dependency,
+        resolve: Callable[[str], str],
+    ) -> Optional[Release]:
+        """
+        Find a dependency among the indexed releases.
+
+        Args:
+            releases_by_url: Releases grouped by resolved repo URL, from _index_releases
+            dep: Dependency to find
+            resolve: Function resolving a repo URL through the redirects
+
+        Returns:
+            The found Release object, or None if not found
+        """
+        releases = releases_by_url.get(resolve(dep.repo_url))
+        if not releases:
+            return None
+
+        # Only parse the spec once the repo is known, so that a dependency on a repo
+        # that isn't in the DB is reported as missing whatever its version says
+        spec = _parse_spec(dep.version)
+        for version, release in releases:
+            if version in spec:
+                return release
 
         return None
 
@@ -586,5 +866,4 @@ class FilesystemPackageRegistry(PackageRegistry):
             True if the package is initialized, False otherwise
         """
         # Check if the package file exists in the package database
-        mod_file_path = os.path.join(self.packages_dir, org, f"{repo_name}.json")
-        return os.path.exists(mod_file_path)
+        return os.path.exists(self._mod_file_path(org, repo_name))
@@ -1,2 +1,17 @@
-from .github_mod_metadata_retriever import GithubModMetadataRetriever
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .mod_metadata_retriever import ModMetadataRetriever
+
+if TYPE_CHECKING:
+    from .github_mod_metadata_retriever import GithubModMetadataRetriever
+
+
+def __getattr__(name: str) -> Any:
+    # The GitHub retriever drags in PyGithub, so only import it when it's used.
+    if name == "GithubModMetadataRetriever":
+        from .github_mod_metadata_retriever import GithubModMetadataRetriever
+
+        return GithubModMetadataRetriever
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,95 @@
+import codecs
 import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from os import environ
 from typing import Any, List, Optional, TypeGuard, cast
 
+import orjson
 import requests
 from github import Auth, Github, GitReleaseAsset
 from github.GitRelease import GitRelease
+from requests.adapters import HTTPAdapter
 from semver import Version
+from urllib3.util.retry import Retry
 
 from zero_infra_mod_registry.models import Dependency, Manifest, Mod, Release, Repo
 from zero_infra_mod_registry.retriever.mod_metadata_retriever import (
+    DEFAULT_MAX_CONCURRENT_RELEASES,
     VALID_MOD_TYPES,
+    VALID_MOD_TYPES_SET,
     VALID_TAGS,
+    VALID_TAGS_SET,
     ModMetadataRetriever,
 )
-from zero_infra_mod_registry.utils.hashes import sha512_sum
+from zero_infra_mod_registry.utils.hashes import sha512_sum_stream
+
+# Connections kept open per host by the default download session. This should be at
+# least the number of threads fetching through one retriever.
+DEFAULT_DOWNLOAD_POOL_SIZE = 10
+
+# Bytes read from the network at a time while hashing a pak
+PAK_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Any version will do here. Matching against it only checks that a range parses.
+_RANGE_CHECK_VERSION = Version.parse("1.0.0")
+
+
+@lru_cache(maxsize=1024)
+def _version_range_error(version_range: str) -> Optional[str]:
+    """
+    Check a dependency version range. The same ranges come up again and again
+    across releases, so results are cached.
+
+    Returns:
+        The error message if the range is invalid, None if it's valid
+    """
+    try:
+        if version_range.startswith("v"):
+            version_range = version_range[1:]
+
+        # Handle caret notation like "^1.0.0" - transform to semver format
+        if version_range.startswith("^"):
+            version_range = ">=" + version_range[1:]
+
+        # Handle comma-separated version ranges like ">=1.0.0,<2.0.0"
+        # by checking each range separately
+        if "," in version_range:
+            for part in version_range.split(","):
+                _RANGE_CHECK_VERSION.match(part.strip())
+        else:
+            _RANGE_CHECK_VERSION.match(version_range)
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+def build_download_session(pool_size: int = DEFAULT_DOWNLOAD_POOL_SIZE) -> requests.Session:
+    """
+    Create the HTTP session used to download mod.json files and paks.
+
+    Connections are kept alive and reused between downloads, and transient
+    failures (rate limiting and gateway errors) are retried with backoff.
+
+    Args:
+        pool_size: Maximum number of connections to keep open per host
+
+    Returns:
+        A configured requests Session
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "zero-infra-mod-registry"
+    return session
 
 
 class GithubModMetadataRetriever(ModMetadataRetriever):
@@ -22,20 +97,42 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
     Implementation of ModMetadataRetriever that retrieves metadata from GitHub repositories.
     """
 
-    def __init__(self, github_client: Optional[Github] = None):
+    def __init__(
+        self,
+        github_client: Optional[Github] = None,
+        session: Optional[requests.Session] = None,
+        max_concurrent_releases: int = DEFAULT_MAX_CONCURRENT_RELEASES,
+    ):
         """
         Initialize a GithubModMetadataRetriever with an optional GitHub client.
         If no client is provided, one will be created using the GITHUB_TOKEN environment variable.
 
         Args:
             github_client: Optional GitHub client to use
+            session: Optional HTTP session to download mod.json files and paks with.
+                Defaults to one from build_download_session.
+            max_concurrent_releases: Maximum number of releases of a repo to process at once
         """
         if github_client is None:
-            auth = Auth.Token(environ.get("GITHUB_TOKEN") or "")
-            self.github_client = Github(auth=auth)
+            token = environ.get("GITHUB_TOKEN")
+            auth = Auth.Token(token) if token else None
+            self.github_client = Github(auth=auth, lazy=True)
         else:
             self.github_client = github_client
 
+        self.session = session if session is not None else build_download_session()
+        self.max_concurrent_releases = max_concurrent_releases
+
+    def close(self) -> None:
+        """Close the pooled connections held by the download session."""
+        self.session.close()
+
+    def __enter__(self) -> "GithubModMetadataRetriever":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def fetch_repo_metadata(self, repo: Repo) -> Optional[Mod]:
         """
         Fetch metadata for all releases in a GitHub repository.
@@ -121,33 +218,41 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
         git_releases = github_repo.get_releases()
 
         logging.info(f"Found {git_releases.totalCount} releases for {repo}")
-        results = []
-        has_error = False
-        for release in git_releases:
-            try:
-                logging.info(f"Processing release {release.tag_name} for {repo}")
-                results.append(self.process_release(repo, release))
-            except KeyError as e:
-                has_error = True
-                print()
-                logging.error(
-                    f"Mod manifest {repo} {release.tag_name} missing required field: {e}"
-                )
-            except Exception as e:
-                has_error = True
-                print()
-                logging.error(
-                    f"Failed to process release {repo} {release.tag_name}: {e}"
-                )
-
-        if has_error:
-            print()
-
+        # Page through the release list up front, then process the releases
+        # concurrently since each one is a couple of independent downloads.
+        releases = list(git_releases)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_releases) as executor:
+            processed = list(
+                executor.map(partial(self._try_process_release, repo), releases)
+            )
+        results = [release for release in processed if release is not None]
         results.sort(key=lambda x: x.release_date, reverse=True)
 
         logging.info(f"Successfully processed {len(results)} releases for {repo}")
         return results
 
+    def _try_process_release(self, repo: Repo, release: GitRelease) -> Optional[Release]:
+        """
+        Process a single GitHub release, logging any failure instead of raising it.
+
+        Args:
+            repo: Repository the release is from
+            release: GitHub release object
+
+        Returns:
+            Release object with metadata, or None if the release failed to process
+        """
+        try:
+            logging.info(f"Processing release {release.tag_name} for {repo}")
+            return self.process_release(repo, release)
+        except KeyError as e:
+            logging.error(
+                f"Mod manifest {repo} {release.tag_name} missing required field: {e}"
+            )
+        except Exception as e:
+            logging.error(f"Failed to process release {repo} {release.tag_name}: {e}")
+        return None
+
     def process_release(self, repo: Repo, release: GitRelease) -> Release:
         """
         Process a single GitHub release and return a Release object.
@@ -168,7 +273,7 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
         )
 
         logging.info(f"Downloading mod.json from {mod_json_url}")
-        response = requests.get(mod_json_url)
+        response = self.session.get(mod_json_url)
 
         if response.status_code == 404:
             raise Exception(f"mod.json does not exist for this release.")
@@ -178,7 +283,8 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
             )
 
         logging.info(f"Successfully downloaded mod.json")
-        response_json = response.json()
+        # requests.json() would let a byte order mark through, orjson doesn't
+        response_json = orjson.loads(response.content.removeprefix(codecs.BOM_UTF8))
 
         response_json["repo_url"] = repo.github_url()
         manifest = Manifest.from_dict(response_json)
@@ -208,8 +314,13 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
 
         assert not isinstance(pak, str), "Expected GitReleaseAsset but got error string"
         pak_asset: GitReleaseAsset.GitReleaseAsset = pak 
-        pak_download = requests.get(pak_asset.browser_download_url)
-        pak_hash = sha512_sum(pak_download.content)
+        # Paks can be large, so hash them as they download rather than buffering them
+        with self.session.get(pak_asset.browser_download_url, stream=True) as pak_download:
+            if pak_download.status_code != 200:
+                raise Exception(
+                    f"Failed to download {pak_asset.name} from {pak_asset.browser_download_url} with status code {pak_download.status_code}"
+                )
+            pak_hash = sha512_sum_stream(pak_download.iter_content(PAK_DOWNLOAD_CHUNK_SIZE))
 
         return Release(
             tag=release.tag_name,
@@ -229,18 +340,18 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
         Returns:
             Asset object representing the .pak file, or an error string if not found or multiple found
         """
-        paks = list(
-            filter(lambda asset: asset.name.endswith(".pak"), release.get_assets())
-        )
-
-        if len(paks) == 0:
+        # The release listing already embeds its assets, so use those rather than
+        # get_assets(), which would cost another API request per release.
+        pak: Optional[GitReleaseAsset.GitReleaseAsset] = None
+        for asset in release.assets:
+            if asset.name.endswith(".pak"):
+                if pak is not None:
+                    return f"Multiple pak files found for release {release.tag_name}."
+                pak = asset
+
+        if pak is None:
             return f"No pak file found for release {release.tag_name}."
 
-        if len(paks) > 1:
-            return f"Multiple pak files found for release {release.tag_name}."
-
-        pak = paks[0]
-
         return pak
 
     def validate_version_tag_name(self, tag_name: str) -> Optional[str]:
@@ -274,29 +385,11 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
         """
         errors = []
         for dependency in dependencies:
-            try:
-                input_version_range = dependency.version
-                if input_version_range.startswith("v"):
-                    input_version_range = input_version_range[1:]
-                
-                # Handle caret notation like "^1.0.0" - transform to semver format
-                if input_version_range.startswith("^"):
-                    input_version_range = ">=" + input_version_range[1:]
-                
-                # Handle comma-separated version ranges like ">=1.0.0,<2.0.0"
-                # Transform to semver format by checking each range separately
-                if "," in input_version_range:
-                    parts = input_version_range.split(",")
-                    for part in parts:
-                        test_version = Version.parse("1.0.0")
-                        test_version.match(part.strip())
-                else:
-                    test_version = Version.parse("1.0.0")
-                    test_version.match(input_version_range)
-            except ValueError as e:
+            error = _version_range_error(dependency.version)
+            if error is not None:
                 dependency_name = "/".join(dependency.repo_url.split("/")[-2:])
                 errors.append(
-                    f"Version Range '{dependency.version}' for dependency '{dependency_name}' does not conform to the semver spec: {e}"
+                    f"Version Range '{dependency.version}' for dependency '{dependency_name}' does not conform to the semver spec: {error}"
                 )
 
         return errors
@@ -311,7 +404,7 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
         Returns:
             Error message if invalid tags found, None if all tags are valid
         """
-        invalid_tags = list(filter(lambda tag: tag not in VALID_TAGS, tags))
+        invalid_tags = [tag for tag in tags if tag not in VALID_TAGS_SET]
         if len(invalid_tags) > 0:
             return f"Invalid tags: {invalid_tags}. Valid tags are: {VALID_TAGS}"
         return None
@@ -326,6 +419,6 @@ class GithubModMetadataRetriever(ModMetadataRetriever):
         Returns:
             Error message if invalid mod type, None if valid
         """
-        if mod_type not in VALID_MOD_TYPES:
+        if mod_type not in VALID_MOD_TYPES_SET:
             return f"Invalid mod type: {mod_type}. Valid types are: {VALID_MOD_TYPES}"
         return None
@@ -16,6 +16,14 @@ VALID_TAGS = [
 
 VALID_MOD_TYPES = ["Client", "Server", "Shared"]
 
+# Set versions of the lists above for membership checks. The lists are kept for
+# their order, which is what error messages show.
+VALID_TAGS_SET = frozenset(VALID_TAGS)
+VALID_MOD_TYPES_SET = frozenset(VALID_MOD_TYPES)
+
+# Default number of releases of a single repo to download and validate at once
+DEFAULT_MAX_CONCURRENT_RELEASES = 4
+
 
 class ModMetadataRetriever(ABC):
     """
@@ -1,8 +1,11 @@
 import gzip
-from typing import Dict
 import hashlib
-import requests
-import base64
+import zlib
+from itertools import chain
+from typing import Iterable
+
+GZIP_MAGIC = b"\x1f\x8b"
+
 
 def sha512_sum(data: bytes) -> str:
     # Check if gzipped
@@ -12,3 +15,35 @@ def sha512_sum(data: bytes) -> str:
     digest = hashlib.sha512()
     digest.update(data)
     return digest.hexdigest()
+
+
+def sha512_sum_stream(chunks: Iterable[bytes]) -> str:
+    """
+    Same as sha512_sum, but for data that arrives in chunks, so it never has to be
+    held in memory all at once. Gzipped data is decompressed as it's hashed.
+    """
+    chunk_iter = iter(chunks)
+
+    # Read just enough to tell whether the data is gzipped
+    head = b""
+    for chunk in chunk_iter:
+        head += chunk
+        if len(head) >= len(GZIP_MAGIC):
+            break
+
+    digest = hashlib.sha512()
+    if not head.startswith(GZIP_MAGIC):
+        for chunk in chain([head], chunk_iter):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chain([head], chunk_iter):
+        digest.update(decompressor.decompress(chunk))
+        # Like gzip.decompress, keep going if another gzip member follows
+        while decompressor.eof and decompressor.unused_data:
+            remaining = decompressor.unused_data
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            digest.update(decompressor.decompress(remaining))
+    digest.update(decompressor.flush())
+    return digest.hexdigest()
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import List
 
+_SEP = os.path.sep
 
+
+@lru_cache(maxsize=8192)
 def repo_to_index_entry(repo: str) -> str:
     """
     An index entry is just $org/$repoName, which happens to be the last 2 pieces 
@@ -15,5 +19,7 @@ def repo_to_index_entry(repo: str) -> str:
     Returns:
         Index entry in the format "org/repo"
     """
-    repo = repo.strip().rstrip(os.path.sep)
-    return os.path.sep.join(repo.split(os.path.sep)[-2:])
+    # Every registry line goes through here, and the same urls come up again when
+    # adding packages, so results are cached.
+    parts = repo.strip().rstrip(_SEP).rsplit(_SEP, 2)
+    return _SEP.join(parts[-2:])
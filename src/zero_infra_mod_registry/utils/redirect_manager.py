@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterable
 
 
 class RedirectManager(ABC):
@@ -25,27 +25,38 @@ class SimpleRedirectManager(RedirectManager):
         """Create a SimpleRedirectManager from a file."""
         try:
             with open(file_path, "r") as file:
-                redirect_lines = file.read().splitlines()
-                return SimpleRedirectManager.parse_redirects(redirect_lines)
+                return SimpleRedirectManager.parse_redirects(file)
         except FileNotFoundError:
             return SimpleRedirectManager({})
 
     @staticmethod
-    def parse_redirects(redirect_lines: List[str]) -> SimpleRedirectManager:
+    def parse_redirects(redirect_lines: Iterable[str]) -> SimpleRedirectManager:
         """Parse redirect lines into a SimpleRedirectManager instance."""
-        parsed_lines = []
+        redirects: Dict[str, str] = {}
         for line in redirect_lines:
-            line = line.strip()
-            if line and " -> " in line:
-                parsed_lines.append(line.split(" -> "))
+            source, arrow, target = line.strip().partition(" -> ")
+            if arrow:
+                # Anything after a second arrow is ignored
+                redirects[source] = target.partition(" -> ")[0]
 
-        redirects = {line[0]: line[1] for line in parsed_lines}
         return SimpleRedirectManager(redirects)
 
     def resolve(self, repo: str) -> str:
-        """Resolve a repository URL through the redirect chain."""
-        if repo in self.redirects:
-            result = self.redirects[repo]
-            return self.resolve(result)
-        else:
-            return repo
+        """
+        Resolve a repository URL through the redirect chain.
+
+        Raises:
+            ValueError: If the redirects form a cycle
+        """
+        # Most repos aren't redirected at all, so only track visited urls once there
+        # is a chain to follow.
+        seen = None
+        while repo in self.redirects:
+            if seen is None:
+                seen = {repo}
+            elif repo in seen:
+                raise ValueError(f"Redirect cycle at {repo}")
+            else:
+                seen.add(repo)
+            repo = self.redirects[repo]
+        return repo
@@ -2,9 +2,12 @@ import os
 import shutil
 import tempfile
 import unittest
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
-from zero_infra_mod_registry.models import Manifest, Mod, Release, Repo
+import orjson
+
+from zero_infra_mod_registry.models import Dependency, Manifest, Mod, Release, Repo
 from zero_infra_mod_registry.registry.filesystem_package_registry import (
     FilesystemPackageRegistry,
 )
@@ -70,6 +73,26 @@ class TestFilesystemPackageRegistryCoreFunctions(TestFilesystemPackageRegistryBa
         self.assertEqual(len(packages), 3)
         self.assertEqual(packages, ["org1/repo1", "org2/repo2", "org3/repo3"])
 
+    def test_load_package_set_rereads_changed_file(self):
+        """Test that the cached package set picks up changes to the file."""
+        package_list_path = os.path.join(self.test_dir, "mod_list_index.txt")
+        with open(package_list_path, "w") as f:
+            f.write("org1/repo1\norg2/repo2\n")
+
+        packages = self.registry._load_package_set(package_list_path)
+        self.assertEqual(packages, {"org1/repo1", "org2/repo2"})
+        self.assertIs(self.registry._load_package_set(package_list_path), packages)
+
+        with open(package_list_path, "a") as f:
+            f.write("org3/repo3\n")
+        self.assertEqual(
+            self.registry._load_package_set(package_list_path),
+            {"org1/repo1", "org2/repo2", "org3/repo3"},
+        )
+
+        os.remove(package_list_path)
+        self.assertEqual(self.registry._load_package_set(package_list_path), set())
+
     def test_get_all_text_lines_in_directory(self):
         """Test getting all text lines from files in a directory."""
         lines = self.registry._get_all_text_lines_in_directory(self.registry_path)
@@ -83,6 +106,23 @@ class TestFilesystemPackageRegistryCoreFunctions(TestFilesystemPackageRegistryBa
         self.assertNotIn("# This is a comment", lines)
         self.assertNotIn("", lines)
 
+    def test_get_all_text_lines_in_directory_recursive(self):
+        """Test that a recursive read includes org directories but skips redirects."""
+        os.makedirs(os.path.join(self.registry_path, "org2"), exist_ok=True)
+        with open(os.path.join(self.registry_path, "org2", "repo3.txt"), "w") as f:
+            f.write("https://github.com/org2/repo3\n")
+        with open(os.path.join(self.registry_path, "redirects", "renames.txt"), "w") as f:
+            f.write("https://github.com/old/repo -> https://github.com/org2/repo3\n")
+
+        flat_lines = self.registry._get_all_text_lines_in_directory(self.registry_path)
+        self.assertEqual(len(flat_lines), 2)
+
+        lines = self.registry._get_all_text_lines_in_directory(
+            self.registry_path, recursive=True
+        )
+        self.assertEqual(len(lines), 3)
+        self.assertIn("https://github.com/org2/repo3", lines)
+
     def test_generate_package_list(self):
         """Test generating a package list from a directory."""
         packages = self.registry._generate_package_list(self.registry_path)
@@ -103,6 +143,16 @@ class TestFilesystemPackageRegistryCoreFunctions(TestFilesystemPackageRegistryBa
             repo_to_index_entry(" https://github.com/org1/repo1 "), "org1/repo1"
         )
 
+    def test_rejects_non_positive_max_concurrent_fetches(self):
+        """Test that the registry refuses a fetch concurrency below 1."""
+        with self.assertRaises(ValueError):
+            FilesystemPackageRegistry(
+                mod_retriever=self.mock_retriever,
+                registry_path=self.registry_path,
+                package_db_path=self.package_db_path,
+                max_concurrent_fetches=0,
+            )
+
     def test_is_package_initialized(self):
         """Test the is_package_initialized method."""
         # Create a mock package file
@@ -140,27 +190,46 @@ class TestModOperations(TestFilesystemPackageRegistryBase):
         self.test_repo = Repo("testorg", "testrepo")
         self.nonexistent_repo = Repo("nonexistent", "repo")
 
-    @patch("builtins.open")
-    def test_load_mod(self, mock_open):
+    def _write_mod_file(self, org, name, content):
+        """Write raw content to a mod file in the package DB and return its path."""
+        org_dir = os.path.join(self.package_db_path, "packages", org)
+        os.makedirs(org_dir, exist_ok=True)
+        mod_file_path = os.path.join(org_dir, f"{name}.json")
+        with open(mod_file_path, "w") as f:
+            f.write(content)
+        return mod_file_path
+
+    def test_load_mod(self):
         """Test load_mod method."""
-        mock_file = MagicMock()
-        mock_open.return_value.__enter__.return_value = mock_file
-        mock_file.read.return_value = '{"name": "test-mod", "releases": []}'
+        mod = self._make_mod("https://github.com/org1/repo1", ["v1.0.0"])
+        self._write_mod_file("org1", "repo1", orjson.dumps(mod.asdict()).decode())
+
+        result = self.registry.load_mod(Repo("org1", "repo1"))
+
+        self.assertEqual(result, mod)
+
+    def test_load_mod_reuses_parsed_mod_until_file_changes(self):
+        """Test that load_mod only reparses a mod file after it changes."""
+        mod_file_path = self._write_mod_file(
+            "org1", "repo1", '{"name": "test-mod", "releases": []}'
+        )
 
-        with patch("json.loads") as mock_loads, patch(
+        with patch(
             "zero_infra_mod_registry.models.Mod.from_dict"
         ) as mock_from_dict:
-            mock_loads.return_value = {"name": "test-mod", "releases": []}
-            mock_mod = MagicMock(spec=Mod)
-            mock_from_dict.return_value = mock_mod
-
+            mock_from_dict.return_value = MagicMock(spec=Mod)
             repo = Repo("org1", "repo1")
-            result = self.registry.load_mod(repo)
 
-            self.assertEqual(result, mock_mod)
-            mock_loads.assert_called_once()
+            first = self.registry.load_mod(repo)
+            second = self.registry.load_mod(repo)
+            self.assertIs(first, second)
             mock_from_dict.assert_called_once()
 
+            with open(mod_file_path, "w") as f:
+                f.write('{"name": "test-mod-renamed", "releases": []}')
+            self.registry.load_mod(repo)
+            self.assertEqual(mock_from_dict.call_count, 2)
+
     def test_load_mod_file_not_found(self):
         """Test load_mod when file is not found."""
         repo = Repo("non_existent", "repo")
@@ -172,6 +241,98 @@ class TestModOperations(TestFilesystemPackageRegistryBase):
         # Just testing that it runs without exceptions
         self.registry.validate_package_db([])
 
+    def _make_mod(self, repo_url, tags, dependencies=()):
+        """Build a Mod with one release per tag, each with the given dependencies."""
+        manifest = Manifest(
+            repo_url=repo_url,
+            name=repo_url.split("/")[-1],
+            description="Test mod",
+            mod_type="Shared",
+            authors=["tester"],
+            dependencies=list(dependencies),
+            tags=[],
+            ag_mod=False,
+        )
+        releases = [
+            Release(
+                tag=tag,
+                hash="abc123",
+                pak_file_name="test.pak",
+                release_date=datetime(2024, 1, 1),
+                manifest=manifest,
+            )
+            for tag in tags
+        ]
+        return Mod(latest_manifest=manifest, releases=releases)
+
+    def test_validate_package_db_dependencies(self):
+        """Test that validate_package_db checks dependency versions and follows redirects."""
+        # The test mod list index references a package that doesn't exist on disk
+        self.registry._load_package_list = MagicMock(return_value=[])
+        base = self._make_mod("https://github.com/org1/base", ["v1.0.0", "v1.2.0"])
+
+        satisfied = self._make_mod(
+            "https://github.com/org1/dependent",
+            ["v1.0.0"],
+            [Dependency(repo_url="https://github.com/org1/base", version="^1.1.0")],
+        )
+        self.assertTrue(self.registry.validate_package_db([base, satisfied]))
+
+        unsatisfied = self._make_mod(
+            "https://github.com/org1/dependent",
+            ["v1.0.0"],
+            [Dependency(repo_url="https://github.com/org1/base", version="^2.0.0")],
+        )
+        self.assertFalse(self.registry.validate_package_db([base, unsatisfied]))
+
+        renamed = self._make_mod(
+            "https://github.com/org1/dependent",
+            ["v1.0.0"],
+            [Dependency(repo_url="https://github.com/old/base", version="v1.0.0")],
+        )
+        self.assertFalse(self.registry.validate_package_db([base, renamed]))
+        self.registry.redirect_manager.redirects["https://github.com/old/base"] = (
+            "https://github.com/org1/base"
+        )
+        self.assertTrue(self.registry.validate_package_db([base, renamed]))
+
+        # A repo that isn't in the DB is missing, even if its version doesn't parse
+        missing = self._make_mod(
+            "https://github.com/org1/dependent",
+            ["v1.0.0"],
+            [Dependency(repo_url="https://github.com/x/missing", version="not a spec!!")],
+        )
+        self.assertFalse(self.registry.validate_package_db([base, missing]))
+
+    def test_validate_new_mods_loads_only_dependencies(self):
+        """Test that validate_new_mods checks new mods against just their dependencies."""
+        base = self._make_mod("https://github.com/org1/base", ["v1.0.0"])
+        os.makedirs(os.path.join(self.package_db_path, "packages", "org1"), exist_ok=True)
+        with open(
+            os.path.join(self.package_db_path, "packages", "org1", "base.json"), "wb"
+        ) as f:
+            f.write(orjson.dumps(base.asdict()))
+
+        dependent = self._make_mod(
+            "https://github.com/org1/dependent",
+            ["v1.0.0"],
+            [Dependency(repo_url="https://github.com/org1/base", version="^1.0.0")],
+        )
+        with patch.object(self.registry, "validate_package_db") as mock_validate:
+            self.assertTrue(self.registry.validate_new_mods([dependent]))
+            mock_validate.assert_not_called()
+
+        unsatisfied = self._make_mod(
+            "https://github.com/org1/dependent",
+            ["v1.0.0"],
+            [Dependency(repo_url="https://github.com/org1/base", version="^2.0.0")],
+        )
+        with patch.object(
+            self.registry, "validate_package_db", return_value=False
+        ) as mock_validate:
+            self.assertFalse(self.registry.validate_new_mods([unsatisfied]))
+            mock_validate.assert_called_once_with([unsatisfied])
+
 
 class TestPackageRegistryUpdates(TestFilesystemPackageRegistryBase):
     """Tests for registry update process and validation functionality."""
@@ -229,6 +390,98 @@ class TestPackageRegistryUpdates(TestFilesystemPackageRegistryBase):
                     content = f.read().strip()
                     self.assertEqual(content, "org1/old_repo")
 
+    def test_process_registry_updates_unchanged_registry(self):
+        """Test that an unchanged registry doesn't rewrite the package list or redirects."""
+        with open(os.path.join(self.registry_path, "org1.txt"), "w") as f:
+            f.write("https://github.com/org1/repo1\n")
+        with open(os.path.join(self.registry_path, "redirects", "renames.txt"), "w") as f:
+            f.write("https://github.com/old/repo1 -> https://github.com/org1/repo1\n")
+
+        with open(self.registry.mod_list_index_path, "w") as f:
+            f.write("org1/repo1\n")
+        with open(self.registry.redirects_path, "w") as f:
+            f.write("https://github.com/old/repo1 -> https://github.com/org1/repo1")
+        index_mtime = os.stat(self.registry.mod_list_index_path).st_mtime_ns
+        redirects_mtime = os.stat(self.registry.redirects_path).st_mtime_ns
+
+        with patch.object(self.registry, "add_package") as mock_init, patch.object(
+            self.registry, "remove_mods"
+        ) as mock_remove_mods:
+            result = self.registry.process_registry_updates()
+
+            self.assertTrue(result)
+            mock_init.assert_not_called()
+            mock_remove_mods.assert_not_called()
+
+        self.assertEqual(
+            os.stat(self.registry.mod_list_index_path).st_mtime_ns, index_mtime
+        )
+        self.assertEqual(os.stat(self.registry.redirects_path).st_mtime_ns, redirects_mtime)
+        self.assertEqual(
+            self.registry.redirect_manager.resolve("https://github.com/old/repo1"),
+            "https://github.com/org1/repo1",
+        )
+
+    def test_process_registry_updates_writes_sorted_package_list(self):
+        """Test that the package list is written sorted and without duplicates."""
+        with open(os.path.join(self.registry_path, "zorg.txt"), "w") as f:
+            f.write("https://github.com/zorg/repo\n")
+        with open(os.path.join(self.registry_path, "aorg.txt"), "w") as f:
+            f.write("https://github.com/aorg/repo\nhttps://github.com/aorg/repo\n")
+
+        with patch.object(self.registry, "add_package") as mock_init:
+            self.assertTrue(self.registry.process_registry_updates())
+
+            args, _ = mock_init.call_args
+            self.assertEqual(args[0], [Repo("aorg", "repo"), Repo("zorg", "repo")])
+
+        with open(self.registry.mod_list_index_path, "r") as f:
+            self.assertEqual(f.read(), "aorg/repo\nzorg/repo\n")
+
+    def test_process_registry_updates_mixed_registry_layouts(self):
+        """Test that flat org files and per-repo files are read together without duplicates."""
+        with open(os.path.join(self.registry_path, "org1.txt"), "w") as f:
+            f.write("https://github.com/org1/repo1\n")
+            f.write("https://github.com/org1/repo2\n")
+            f.write("https://github.com/org2/repo3\n")
+        os.makedirs(os.path.join(self.registry_path, "org1"), exist_ok=True)
+        with open(os.path.join(self.registry_path, "org1", "repo1.txt"), "w") as f:
+            f.write("https://github.com/org1/repo1\n")
+        os.makedirs(os.path.join(self.registry_path, "org2"), exist_ok=True)
+        with open(os.path.join(self.registry_path, "org2", "repo4.txt"), "w") as f:
+            f.write("https://github.com/org2/repo4\n")
+
+        with patch.object(self.registry, "add_package") as mock_init:
+            self.assertTrue(self.registry.process_registry_updates())
+
+            args, _ = mock_init.call_args
+            self.assertEqual(
+                args[0],
+                [
+                    Repo("org1", "repo1"),
+                    Repo("org1", "repo2"),
+                    Repo("org2", "repo3"),
+                    Repo("org2", "repo4"),
+                ],
+            )
+
+        with open(self.registry.mod_list_index_path, "r") as f:
+            self.assertEqual(
+                f.read(), "org1/repo1\norg1/repo2\norg2/repo3\norg2/repo4\n"
+            )
+
+    @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
+    def test_process_registry_updates_failed_fetch(self, mock_logging):
+        """Test that a failed fetch leaves the package list alone so the repo is retried."""
+        with open(os.path.join(self.registry_path, "org1.txt"), "w") as f:
+            f.write("https://github.com/org1/repo1\n")
+        self.mock_retriever.fetch_repo_metadata.side_effect = RuntimeError("boom")
+
+        result = self.registry.process_registry_updates()
+
+        self.assertFalse(result)
+        self.assertFalse(os.path.exists(self.registry.mod_list_index_path))
+
 
 class TestAddRelease(TestFilesystemPackageRegistryBase):
     """Tests for the add_package_release functionality."""
@@ -296,8 +549,8 @@ class TestAddRelease(TestFilesystemPackageRegistryBase):
             return_value=updated_mod
         )
 
-        # Mock validate_package_db
-        self.registry.validate_package_db = MagicMock()
+        # Mock validate_new_mods
+        self.registry.validate_new_mods = MagicMock()
 
         # Call add_package_release
         result = self.registry.add_package_release(self.test_repo, "v1.0.0", dry_run=True)
@@ -312,7 +565,7 @@ class TestAddRelease(TestFilesystemPackageRegistryBase):
         self.mock_retriever.update_mod_with_release.assert_called_once_with(
             mock_mod, mock_release
         )
-        self.registry.validate_package_db.assert_called_once_with([updated_mod])
+        self.registry.validate_new_mods.assert_called_once_with([updated_mod])
     
     @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
     def test_add_release_skips_existing_tag(self, mock_logging):
@@ -365,8 +618,8 @@ class TestRepositoryInitialization(TestFilesystemPackageRegistryBase):
     @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
     def test_init_creates_package_file_and_registry_entry(self, mock_logging):
         """Test that add_package creates both a package file and a registry entry."""
-        # Mock validate_package_db
-        self.registry.validate_package_db = MagicMock()
+        # Mock validate_new_mods
+        self.registry.validate_new_mods = MagicMock()
         
         # Call add_package
         result = self.registry.add_package([self.test_repo])
@@ -387,11 +640,25 @@ class TestRepositoryInitialization(TestFilesystemPackageRegistryBase):
             content = f.read().strip()
             self.assertEqual(content, self.repo_url)
     
+    @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
+    def test_init_appends_to_index_without_trailing_newline(self, mock_logging):
+        """Test that add_package doesn't merge its entry into an unterminated last line."""
+        self.registry.validate_new_mods = MagicMock()
+        with open(self.registry.mod_list_index_path, "w") as f:
+            f.write("org1/repo1")
+
+        self.registry.add_package([self.test_repo])
+
+        self.assertEqual(
+            self.registry._load_package_list(self.registry.mod_list_index_path),
+            ["org1/repo1", "testorg/testrepo"],
+        )
+
     @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
     def test_init_dry_run(self, mock_logging):
         """Test that add_package in dry run mode doesn't create files."""
-        # Mock validate_package_db
-        self.registry.validate_package_db = MagicMock()
+        # Mock validate_new_mods
+        self.registry.validate_new_mods = MagicMock()
         
         # Call add_package in dry run mode
         result = self.registry.add_package([self.test_repo], dry_run=True)
@@ -412,8 +679,8 @@ class TestRepositoryInitialization(TestFilesystemPackageRegistryBase):
     @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
     def test_init_with_existing_registry_entry(self, mock_logging):
         """Test that add_package doesn't create a duplicate registry entry."""
-        # Mock validate_package_db
-        self.registry.validate_package_db = MagicMock()
+        # Mock validate_new_mods
+        self.registry.validate_new_mods = MagicMock()
         
         # Create the registry entry first
         os.makedirs(os.path.join(self.registry_path, "testorg"), exist_ok=True)
@@ -427,15 +694,28 @@ class TestRepositoryInitialization(TestFilesystemPackageRegistryBase):
         package_file_path = os.path.join(self.package_db_path, "packages", "testorg", "testrepo.json")
         self.assertTrue(os.path.exists(package_file_path), f"Package file {package_file_path} was not created")
         
-        # Check if logging indicates the entry already exists
-        found_log = False
-        for call in mock_logging.info.call_args_list:
-            args, _ = call
-            if len(args) > 0 and "already exists" in args[0] and "testorg/testrepo" in args[0]:
-                found_log = True
-                break
-        
-        self.assertTrue(found_log, "Did not log that the registry entry already exists")
+        # Check that logging indicates the entry already exists
+        mock_logging.info.assert_any_call(
+            "Package testorg/testrepo already exists in the registry"
+        )
+
+    @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
+    def test_init_with_existing_flat_registry_entry(self, mock_logging):
+        """Test that an entry in a flat org file isn't added again as a per-repo file."""
+        self.registry.validate_new_mods = MagicMock()
+
+        with open(os.path.join(self.registry_path, "testorg.txt"), "w") as f:
+            f.write("https://github.com/testorg/other\n")
+            f.write(f"{self.repo_url}\n")
+
+        self.assertEqual(self.registry.add_package([self.test_repo]), 1)
+
+        self.assertFalse(
+            os.path.exists(os.path.join(self.registry_path, "testorg", "testrepo.txt"))
+        )
+        mock_logging.info.assert_any_call(
+            "Package testorg/testrepo already exists in the registry"
+        )
 
     @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
     def test_init_with_failed_repo_metadata_fetch(self, mock_logging):
@@ -459,6 +739,24 @@ class TestRepositoryInitialization(TestFilesystemPackageRegistryBase):
         # Verify that the correct error log was shown
         mock_logging.error.assert_any_call("Failed to initialize some repos.")
     
+    @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
+    def test_init_with_repo_metadata_fetch_exception(self, mock_logging):
+        """Test that an exception fetching one repo is treated as a failed fetch."""
+        failing_repo = Repo("brokenorg", "brokenrepo")
+
+        def fetch(repo):
+            if repo == failing_repo:
+                raise RuntimeError("boom")
+            return self.mock_mod
+
+        self.mock_retriever.fetch_repo_metadata = MagicMock(side_effect=fetch)
+
+        result = self.registry.add_package([self.test_repo, failing_repo])
+
+        self.assertEqual(result, 0)
+        mock_logging.error.assert_any_call("Failed to initialize some repos.")
+        mock_logging.error.assert_any_call(f"Failed repos: {failing_repo}")
+
     @patch("zero_infra_mod_registry.registry.filesystem_package_registry.logging")
     def test_init_multiple_repos(self, mock_logging):
         """Test that add_package can initialize multiple repositories at once."""
@@ -480,8 +778,8 @@ class TestRepositoryInitialization(TestFilesystemPackageRegistryBase):
         # Mock the fetch_repo_metadata method
         self.mock_retriever.fetch_repo_metadata = MagicMock(side_effect=[mock_mod1, mock_mod2])
         
-        # Mock validate_package_db
-        self.registry.validate_package_db = MagicMock()
+        # Mock validate_new_mods
+        self.registry.validate_new_mods = MagicMock()
         
         # Call add_package with multiple repos
         result = self.registry.add_package([test_repo1, test_repo2])
@@ -1,6 +1,9 @@
+import codecs
 import unittest
 from unittest.mock import MagicMock, patch
 
+import orjson
+
 from zero_infra_mod_registry.models.mod_metadata import Dependency, Mod, Release, Repo
 from zero_infra_mod_registry.retriever.github_mod_metadata_retriever import (
     GithubModMetadataRetriever,
@@ -37,7 +40,8 @@ class TestGithubModMetadataRetriever(unittest.TestCase):
         """Test mod type validation."""
         # Valid mod types
         for mod_type in VALID_MOD_TYPES:
-            self.assertIsNone(self.mod_retriever.validate_mod_type(mod_type))
+            with self.subTest(mod_type=mod_type):
+                self.assertIsNone(self.mod_retriever.validate_mod_type(mod_type))
 
         # Invalid mod type
         invalid_mod_type = "InvalidType"
@@ -51,14 +55,16 @@ class TestGithubModMetadataRetriever(unittest.TestCase):
         # Valid version tags
         valid_tags = ["1.0.0", "v1.0.0", "1.2.3-beta.1"]
         for tag in valid_tags:
-            self.assertIsNone(self.mod_retriever.validate_version_tag_name(tag))
+            with self.subTest(tag=tag):
+                self.assertIsNone(self.mod_retriever.validate_version_tag_name(tag))
 
         # Invalid version tags
         invalid_tags = ["version1", "v"]
         for tag in invalid_tags:
-            error = self.mod_retriever.validate_version_tag_name(tag)
-            self.assertIsNotNone(error)
-            self.assertIn(tag.lstrip("v"), error)
+            with self.subTest(tag=tag):
+                error = self.mod_retriever.validate_version_tag_name(tag)
+                self.assertIsNotNone(error)
+                self.assertIn(tag.lstrip("v"), error)
 
     def test_validate_dependency_versions(self):
         """Test dependency version validation."""
@@ -84,8 +90,7 @@ class TestGithubModMetadataRetriever(unittest.TestCase):
         for error in errors:
             self.assertIn("does not conform to the semver spec", error)
 
-    @patch("requests.get")
-    def test_find_pak_file(self, mock_requests_get):
+    def test_find_pak_file(self):
         """Test finding a pak file in release assets."""
         # Mock a release with a single pak file
         mock_release = MagicMock()
@@ -99,14 +104,14 @@ class TestGithubModMetadataRetriever(unittest.TestCase):
         mock_asset2 = MagicMock()
         mock_asset2.name = "readme.md"
 
-        mock_release.get_assets.return_value = [mock_asset1, mock_asset2]
+        mock_release.assets = [mock_asset1, mock_asset2]
 
         # Test finding the pak file
         result = self.mod_retriever.find_pak_file(mock_release)
         self.assertEqual(result, mock_asset1)
 
         # Test when no pak file exists
-        mock_release.get_assets.return_value = [mock_asset2]
+        mock_release.assets = [mock_asset2]
         result = self.mod_retriever.find_pak_file(mock_release)
         self.assertIsInstance(result, str)
         self.assertIn("No pak file found", result)
@@ -114,11 +119,14 @@ class TestGithubModMetadataRetriever(unittest.TestCase):
         # Test when multiple pak files exist
         mock_asset3 = MagicMock()
         mock_asset3.name = "mod2.pak"
-        mock_release.get_assets.return_value = [mock_asset1, mock_asset3]
+        mock_release.assets = [mock_asset1, mock_asset3]
         result = self.mod_retriever.find_pak_file(mock_release)
         self.assertIsInstance(result, str)
         self.assertIn("Multiple pak files found", result)
 
+        # Assets come from the release itself, not a separate API call
+        mock_release.get_assets.assert_not_called()
+
     @patch(
         "zero_infra_mod_registry.retriever.github_mod_metadata_retriever.GithubModMetadataRetriever.process_release"
     )
@@ -207,8 +215,7 @@ class TestGithubModMetadataRetriever(unittest.TestCase):
         # Verify the latest manifest is from the newest release
         self.assertEqual(updated_mod.latest_manifest, mock_manifest3)
 
-    @patch("requests.get")
-    def test_fetch_release_metadata(self, mock_requests_get):
+    def test_fetch_release_metadata(self):
         """Test fetching metadata for a specific release."""
         # Create a mock mod
         mock_manifest = MagicMock()
@@ -238,6 +245,61 @@ class TestGithubModMetadataRetriever(unittest.TestCase):
             mock_github_repo.get_release.assert_called_once_with("v1.2.0")
             self.mod_retriever.process_release.assert_called_once()
 
+    def test_context_manager_closes_session(self):
+        """Test that leaving a with block closes the download session, even on error."""
+        mock_session = MagicMock()
+        retriever = GithubModMetadataRetriever(self.mock_github, mock_session)
+
+        with self.assertRaises(RuntimeError):
+            with retriever as mod_retriever:
+                self.assertIs(mod_retriever, retriever)
+                mock_session.close.assert_not_called()
+                raise RuntimeError("command failed")
+
+        mock_session.close.assert_called_once_with()
+
+    def test_process_release_downloads_through_session(self):
+        """Test that mod.json is downloaded with the retriever's session."""
+        mock_session = MagicMock()
+        mock_session.get.return_value.status_code = 404
+        mod_retriever = GithubModMetadataRetriever(self.mock_github, mock_session)
+
+        mock_release = MagicMock()
+        mock_release.tag_name = "v1.0.0"
+
+        with self.assertRaises(Exception) as context:
+            mod_retriever.process_release(Repo("testorg", "testrepo"), mock_release)
+
+        self.assertIn("mod.json does not exist", str(context.exception))
+        mock_session.get.assert_called_once_with(
+            "https://raw.githubusercontent.com/testorg/testrepo/v1.0.0/mod.json"
+        )
+
+    def test_process_release_parses_mod_json_with_bom(self):
+        """Test that a mod.json saved with a UTF-8 byte order mark still parses."""
+        mod_json = {
+            "name": "Test Mod",
+            "description": "A test mod",
+            "mod_type": "Client",
+            "authors": ["Test Author"],
+            "dependencies": [],
+            "tags": ["Mutator"],
+        }
+        mock_session = MagicMock()
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = codecs.BOM_UTF8 + orjson.dumps(mod_json)
+        mod_retriever = GithubModMetadataRetriever(self.mock_github, mock_session)
+
+        mock_release = MagicMock()
+        mock_release.tag_name = "v1.0.0"
+        mock_release.assets = []
+
+        # The manifest parses, so validation gets as far as the missing pak
+        with self.assertRaises(Exception) as context:
+            mod_retriever.process_release(Repo("testorg", "testrepo"), mock_release)
+
+        self.assertIn("No pak file found", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
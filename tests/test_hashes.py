@@ -0,0 +1,33 @@
+import gzip
+import unittest
+
+from zero_infra_mod_registry.utils.hashes import sha512_sum, sha512_sum_stream
+
+
+def _chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestHashes(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 64
+
+    def test_stream_matches_sha512_sum(self):
+        """Test that hashing in chunks gives the same result as hashing all at once."""
+        for size in (1, 7, 4096, len(self.data)):
+            self.assertEqual(
+                sha512_sum_stream(_chunked(self.data, size)), sha512_sum(self.data)
+            )
+
+    def test_stream_decompresses_gzip(self):
+        """Test that gzipped data is hashed by its decompressed contents."""
+        gzipped = gzip.compress(self.data) + gzip.compress(self.data)
+
+        for size in (1, 7, 4096, len(gzipped)):
+            self.assertEqual(
+                sha512_sum_stream(_chunked(gzipped, size)), sha512_sum(gzipped)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
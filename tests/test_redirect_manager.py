@@ -2,19 +2,19 @@ import os
 import shutil
 import tempfile
 import unittest
-from pathlib import Path
 
 from zero_infra_mod_registry.utils.redirect_manager import SimpleRedirectManager
 
 
 class TestSimpleRedirectManager(unittest.TestCase):
-    def setUp(self):
-        # Create a temporary directory for test files
-        self.test_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        # The redirects file is only ever read, so all tests share one copy of it
+        cls.test_dir = tempfile.mkdtemp()
 
         # Create a test redirects file
-        self.redirects_path = os.path.join(self.test_dir, "redirects.txt")
-        with open(self.redirects_path, "w") as f:
+        cls.redirects_path = os.path.join(cls.test_dir, "redirects.txt")
+        with open(cls.redirects_path, "w") as f:
             f.write(
                 "https://github.com/old-org/repo1 -> https://github.com/new-org/repo1\n"
                 + "https://github.com/old-org/repo2 -> https://github.com/new-org/repo2\n"
@@ -24,9 +24,10 @@ class TestSimpleRedirectManager(unittest.TestCase):
                 + "https://github.com/no-arrow-org/repo1\n"
             )
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         # Remove the temporary directory and its contents
-        shutil.rmtree(self.test_dir)
+        shutil.rmtree(cls.test_dir)
 
     def test_init(self):
         """Test initializing a SimpleRedirectManager with a dictionary."""
@@ -118,6 +119,18 @@ class TestSimpleRedirectManager(unittest.TestCase):
         resolved = manager.resolve("https://github.com/stable-org/repo1")
         self.assertEqual(resolved, "https://github.com/stable-org/repo1")
 
+    def test_resolve_cycle(self):
+        """Test that a redirect cycle is reported instead of looping forever."""
+        manager = SimpleRedirectManager(
+            {
+                "https://github.com/a/repo": "https://github.com/b/repo",
+                "https://github.com/b/repo": "https://github.com/a/repo",
+            }
+        )
+
+        with self.assertRaises(ValueError):
+            manager.resolve("https://github.com/a/repo")
+
 
 if __name__ == "__main__":
     unittest.main()